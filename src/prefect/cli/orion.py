@@ -124,8 +124,7 @@ async def start(
                 command=[
                     "uvicorn",
                     "--app-dir",
-                    # quote wrapping needed for windows paths with spaces
-                    f'"{prefect.__module_path__.parent}"',
+                    str(prefect.__module_path__.parent),
                     "--factory",
                     "prefect.orion.api.server:create_app",
                     "--host",
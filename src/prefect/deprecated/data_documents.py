@@ -14,15 +14,17 @@ from typing import (
     Union,
 )
 
-import cloudpickle
 import pydantic
 from typing_extensions import Protocol
 
 from prefect.orion.utilities.schemas import PrefectBaseModel
+from prefect.utilities.importtools import lazy_import
 
 if TYPE_CHECKING:
     from prefect.packaging.base import PackageManifest
 
+cloudpickle = lazy_import("cloudpickle")
+
 T = TypeVar("T", bound="DataDocument")  # Generic for DataDocument class types
 D = TypeVar("D", bound=Any)  # Generic for DataDocument data types
 
@@ -1,5 +1,6 @@
 import copy
 import enum
+import json
 import os
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Tuple, Union
@@ -27,6 +28,13 @@ if TYPE_CHECKING:
 else:
     kubernetes = lazy_import("kubernetes")
 
+# Prefer the libyaml-backed loader, which is much faster than the pure Python one, when
+# PyYAML was built with libyaml support
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 class KubernetesImagePullPolicy(enum.Enum):
     IF_NOT_PRESENT = "IfNotPresent"
@@ -41,6 +49,71 @@ class KubernetesRestartPolicy(enum.Enum):
 
 KubernetesManifest = Dict[str, Any]
 
+# Types that can be shared between a manifest and its clone
+_IMMUTABLE_MANIFEST_TYPES = (str, int, float, bool, type(None))
+
+
+def _clone_manifest(value: Any) -> Any:
+    """
+    Copy a JSON-like manifest made of dicts, lists and scalar values.
+
+    This is considerably faster than `copy.deepcopy` since it does not need to track
+    shared references or dispatch on arbitrary types. Any other values, including
+    subclasses of `dict` and `list`, are copied with `copy.deepcopy`.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _clone_manifest(item) for key, item in value.items()}
+    if value_type is list:
+        return [_clone_manifest(item) for item in value]
+    if value_type in _IMMUTABLE_MANIFEST_TYPES:
+        return value
+    return copy.deepcopy(value)
+
+
+# Parsed manifest files, keyed by path, along with the file stamp they were read at
+_MANIFEST_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_NOT_PARSED = object()
+
+
+def _reject_json_constant(constant: str) -> Any:
+    raise ValueError(f"Unsupported JSON constant {constant!r}")
+
+
+def _load_manifest_file(filename: str) -> Any:
+    """
+    Load a YAML or JSON file, reusing the parsed contents if the file has not changed
+    since it was last read.
+
+    A copy is returned on each call so callers are free to mutate the result.
+    """
+    filename = str(filename)
+    stat = os.stat(filename)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _MANIFEST_FILE_CACHE.get(filename)
+    if cached is None or cached[0] != stamp:
+        with open(filename, "r", encoding="utf-8") as f:
+            contents = f.read()
+
+        parsed = _NOT_PARSED
+        if filename.endswith(".json"):
+            # The C-accelerated JSON parser is considerably faster than YAML parsing;
+            # fall back to YAML for files that are not strictly valid JSON, including
+            # files using the non-standard `NaN` and `Infinity` constants
+            try:
+                parsed = json.loads(contents, parse_constant=_reject_json_constant)
+            except ValueError:
+                pass
+
+        if parsed is _NOT_PARSED:
+            parsed = yaml.load(contents, _SafeLoader)
+
+        cached = (stamp, parsed)
+        _MANIFEST_FILE_CACHE[filename] = cached
+
+    return _clone_manifest(cached[1])
+
 
 class KubernetesJobResult(InfrastructureResult):
     """Contains information about the final state of a completed Kubernetes Job"""
@@ -50,6 +123,11 @@ class KubernetesJob(Infrastructure):
     """
     Runs a command as a Kubernetes Job.
 
+    Job manifests and customizations can be loaded from YAML or JSON files with
+    `job_from_file` and `customize_from_file`. These parse YAML with the faster libyaml
+    loader when PyYAML was built against the libyaml C library, and with PyYAML's
+    pure Python loader otherwise.
+
     Attributes:
         cluster_config: An optional Kubernetes cluster config to use for this job.
         command: A list of strings specifying the command to run in the container to
@@ -250,18 +328,23 @@ class KubernetesJob(Infrastructure):
     #   > implicit typing recommendations.
     #
     #   https://yaml.org/spec/1.2.2/#12-yaml-history
+    #
+    # Files with a `.json` extension are parsed with the faster `json` module first.
+    # PyYAML implements YAML 1.1, so the two do not agree on every value: numbers with
+    # exponents without an explicit sign, like `1e3` or `1.5e3`, or without a decimal
+    # point, like `1e+3`, are strings to PyYAML but floats to `json`. `NaN` and
+    # `Infinity` are not valid JSON for the Kubernetes API, so files using them are left
+    # to the YAML loader, which reads them as strings.
 
     @classmethod
     def job_from_file(cls, filename: str) -> KubernetesManifest:
         """Load a Kubernetes Job manifest from a YAML or JSON file."""
-        with open(filename, "r", encoding="utf-8") as f:
-            return yaml.load(f, yaml.SafeLoader)
+        return _load_manifest_file(filename)
 
     @classmethod
     def customize_from_file(cls, filename: str) -> JsonPatch:
         """Load an RFC 6902 JSON patch from a YAML or JSON file."""
-        with open(filename, "r", encoding="utf-8") as f:
-            return JsonPatch(yaml.load(f, yaml.SafeLoader))
+        return JsonPatch(_load_manifest_file(filename))
 
     @sync_compatible
     async def run(
@@ -330,9 +413,21 @@ class KubernetesJob(Infrastructure):
 
     def build_job(self) -> KubernetesManifest:
         """Builds the Kubernetes Job Manifest"""
-        job_manifest = copy.copy(self.job)
-        job_manifest = self._shortcut_customizations().apply(job_manifest)
-        job_manifest = self.customizations.apply(job_manifest)
+        # Copy the job once and apply every customization to that copy in place, rather
+        # than letting each patch make its own deep copy of the manifest
+        job_manifest = _clone_manifest(self.job)
+        job_manifest = self._shortcut_customizations().apply(
+            job_manifest, in_place=True
+        )
+
+        # Environment variables are appended in a single step rather than as one JSON
+        # patch operation per variable
+        job_manifest["spec"]["template"]["spec"]["containers"][0]["env"].extend(
+            {"name": key, "value": value}
+            for key, value in self._get_environment_variables().items()
+        )
+
+        job_manifest = self.customizations.apply(job_manifest, in_place=True)
         return job_manifest
 
     @contextmanager
@@ -453,15 +548,6 @@ class KubernetesJob(Infrastructure):
             for key, value in self.labels.items()
         ]
 
-        shortcuts += [
-            {
-                "op": "add",
-                "path": "/spec/template/spec/containers/0/env/-",
-                "value": {"name": key, "value": value},
-            }
-            for key, value in self._get_environment_variables().items()
-        ]
-
         if self.image_pull_policy:
             shortcuts.append(
                 {
@@ -494,7 +580,8 @@ class KubernetesJob(Infrastructure):
                 {
                     "op": "add",
                     "path": "/spec/template/spec/containers/0/args",
-                    "value": self.command,
+                    # Copied so the built manifest does not share the block's list
+                    "value": list(self.command),
                 }
             )
 
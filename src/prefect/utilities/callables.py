@@ -5,7 +5,6 @@ import inspect
 from functools import partial
 from typing import Any, Callable, Dict, Iterable, List, Tuple
 
-import cloudpickle
 import pydantic
 import pydantic.schema
 from typing_extensions import Literal
@@ -15,6 +14,9 @@ from prefect.exceptions import (
     ReservedArgumentError,
     SignatureMismatchError,
 )
+from prefect.utilities.importtools import lazy_import
+
+cloudpickle = lazy_import("cloudpickle")
 
 
 def get_call_parameters(
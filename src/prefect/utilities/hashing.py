@@ -4,9 +4,11 @@ from functools import partial
 from pathlib import Path
 from typing import Optional, Union
 
-import cloudpickle
-
 from prefect.serializers import JSONSerializer
+from prefect.utilities.importtools import lazy_import
+
+# Only needed when hashing objects that are not JSON serializable
+cloudpickle = lazy_import("cloudpickle")
 
 if sys.version_info[:2] >= (3, 9):
     _md5 = partial(hashlib.md5, usedforsecurity=False)
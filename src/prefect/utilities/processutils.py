@@ -10,7 +10,6 @@ from typing import (
     IO,
     Any,
     Callable,
-    List,
     Mapping,
     Optional,
     Sequence,
@@ -21,10 +20,14 @@ from typing import (
 
 import anyio
 import anyio.abc
+import anyio.to_thread
 from anyio.streams.text import TextReceiveStream, TextSendStream
 
 TextSink = Union[anyio.AsyncFile, TextIO, TextSendStream]
 
+# Seconds to spend discarding unread subprocess output when a reader is cancelled
+_CANCELLED_DRAIN_TIMEOUT = 0.1
+
 
 if sys.platform == "win32":
     from ctypes import WINFUNCTYPE, c_int, c_uint, windll
@@ -178,7 +181,7 @@ if sys.platform == "win32":
 
 
 @asynccontextmanager
-async def open_process(command: List[str], **kwargs):
+async def open_process(command: Sequence[str], **kwargs):
     """
     Like `anyio.open_process` but with:
     - Support for Windows command joining
@@ -188,17 +191,17 @@ async def open_process(command: List[str], **kwargs):
     # Passing a string to open_process is equivalent to shell=True which is
     # generally necessary for Unix-like commands on Windows but otherwise should
     # be avoided
-    if not isinstance(command, list):
+    if isinstance(command, (str, bytes)):
         raise TypeError(
-            "The command passed to open process must be a list. You passed the command"
-            f"'{command}', which is type '{type(command)}'."
+            "The command passed to open process must be a list of arguments. You passed "
+            f"the command '{command}', which is type '{type(command)}'."
         )
 
     if sys.platform == "win32":
-        command = " ".join(command)
+        command = _join_windows_command(command)
         process = await _open_anyio_process(command, **kwargs)
     else:
-        process = await anyio.open_process(command, **kwargs)
+        process = await anyio.open_process(list(command), **kwargs)
 
     # if there's a creationflags kwarg and it contains CREATE_NEW_PROCESS_GROUP,
     # use SetConsoleCtrlHandler to handle CTRL-C
@@ -219,14 +222,16 @@ async def open_process(command: List[str], **kwargs):
         async with process:
             yield process
     finally:
-        try:
-            process.terminate()
-            if win32_process_group:
-                _windows_process_group_pids.remove(process.pid)
+        # Skip signalling a process that has already exited
+        if process.returncode is None:
+            try:
+                process.terminate()
+            except OSError:
+                # Occurs if the process terminated since the return code was checked
+                pass
 
-        except OSError:
-            # Occurs if the process is already terminated
-            pass
+        if win32_process_group:
+            _windows_process_group_pids.discard(process.pid)
 
         # Ensure the process resource is closed. If not shielded from cancellation,
         # this resource can be left open and the subprocess output can appear after
@@ -235,8 +240,23 @@ async def open_process(command: List[str], **kwargs):
             await process.aclose()
 
 
+def _join_windows_command(command: Sequence[str]) -> str:
+    """
+    Join a command into a single string for Windows.
+
+    Arguments are quoted as needed with `subprocess.list2cmdline`, except for arguments
+    that the caller already wrapped in double quotes, which are passed through as is.
+    """
+    return " ".join(
+        arg
+        if len(arg) > 1 and arg.startswith('"') and arg.endswith('"')
+        else subprocess.list2cmdline([arg])
+        for arg in command
+    )
+
+
 async def run_process(
-    command: List[str],
+    command: Sequence[str],
     stream_output: Union[bool, Tuple[Optional[TextSink], Optional[TextSink]]] = False,
     task_status: Optional[anyio.abc.TaskStatus] = None,
     task_status_handler: Optional[Callable[[anyio.abc.Process], Any]] = None,
@@ -253,11 +273,16 @@ async def run_process(
     """
     if stream_output is True:
         stream_output = (sys.stdout, sys.stderr)
+    elif not stream_output:
+        stream_output = (None, None)
+
+    # Only pipe streams that have a sink to write to
+    stdout_sink, stderr_sink = stream_output
 
     async with open_process(
         command,
-        stdout=subprocess.PIPE if stream_output else subprocess.DEVNULL,
-        stderr=subprocess.PIPE if stream_output else subprocess.DEVNULL,
+        stdout=subprocess.PIPE if stdout_sink is not None else subprocess.DEVNULL,
+        stderr=subprocess.PIPE if stderr_sink is not None else subprocess.DEVNULL,
         **kwargs,
     ) as process:
 
@@ -267,9 +292,9 @@ async def run_process(
 
             task_status.started(task_status_handler(process))
 
-        if stream_output:
+        if stdout_sink is not None or stderr_sink is not None:
             await consume_process_output(
-                process, stdout_sink=stream_output[0], stderr_sink=stream_output[1]
+                process, stdout_sink=stdout_sink, stderr_sink=stderr_sink
             )
 
         await process.wait()
@@ -283,33 +308,70 @@ async def consume_process_output(
     stderr_sink: Optional[TextSink] = None,
 ):
     async with anyio.create_task_group() as tg:
-        tg.start_soon(
-            stream_text,
-            TextReceiveStream(process.stdout),
-            stdout_sink,
-        )
-        tg.start_soon(
-            stream_text,
-            TextReceiveStream(process.stderr),
-            stderr_sink,
-        )
+        # Streams that were not piped do not need to be read
+        if process.stdout is not None:
+            tg.start_soon(
+                stream_text,
+                TextReceiveStream(process.stdout),
+                stdout_sink,
+            )
+        if process.stderr is not None:
+            tg.start_soon(
+                stream_text,
+                TextReceiveStream(process.stderr),
+                stderr_sink,
+            )
 
 
 async def stream_text(source: TextReceiveStream, sink: Optional[TextSink]):
-    if isinstance(sink, TextIOBase):
-        # Convert the blocking sink to an async-compatible object
-        sink = anyio.wrap_file(sink)
-
-    async for item in source:
-        if isinstance(sink, TextSendStream):
-            await sink.send(item)
-        elif isinstance(sink, anyio.AsyncFile):
-            await sink.write(item)
-            await sink.flush()
-        elif sink is None:
-            pass  # Consume the item but perform no action
+    # Resolve how to write to the sink once instead of for every item
+    if sink is sys.stdout or sink is sys.stderr:
+        # Writing to the standard streams is cheap enough to do from the event loop
+        # without a round trip to a worker thread
+        stream = sink
+
+        async def write(item: str) -> None:
+            _write_and_flush(stream, item)
+            # Yield to other tasks since receiving from the source may not
+            await anyio.sleep(0)
+
+    elif isinstance(sink, (TextIOBase, anyio.AsyncFile)):
+        # Blocking files are written to from a worker thread
+        file = sink.wrapped if isinstance(sink, anyio.AsyncFile) else sink
+
+        async def write(item: str) -> None:
+            # Write and flush in a single worker thread call instead of two
+            await anyio.to_thread.run_sync(_write_and_flush, file, item)
+
+    elif isinstance(sink, TextSendStream):
+        write = sink.send
+    elif sink is None:
+        write = None
+    else:
+        raise TypeError(f"Unsupported sink type {type(sink).__name__}")
+
+    try:
+        if write is None:
+            async for _ in source:
+                pass  # Consume the item but perform no action
         else:
-            raise TypeError(f"Unsupported sink type {type(sink).__name__}")
+            async for item in source:
+                await write(item)
+    except anyio.get_cancelled_exc_class():
+        # Discard any output still buffered in the pipe so the process resources can
+        # be closed promptly, without waiting indefinitely on a chatty process
+        with anyio.move_on_after(_CANCELLED_DRAIN_TIMEOUT, shield=True):
+            try:
+                async for _ in source:
+                    pass
+            except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+                pass
+        raise
+
+
+def _write_and_flush(file: IO[str], text: str) -> None:
+    file.write(text)
+    file.flush()
 
 
 def kill_on_interrupt(pid: int, process_name: str, print_fn: Callable):
@@ -1,4 +1,5 @@
 import json
+from collections import OrderedDict
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict
@@ -127,6 +128,28 @@ def test_building_a_job_is_idempotent():
     assert first_time == second_time
 
 
+def test_building_a_job_does_not_modify_the_block():
+    k8s_job = KubernetesJob(command=["echo", "hello"], env={"FOO": "bar"})
+    original_job = json.loads(json.dumps(k8s_job.job))
+
+    manifest = k8s_job.build_job()
+    manifest["spec"]["template"]["spec"]["containers"][0]["args"].append("world")
+
+    assert k8s_job.job == original_job
+    assert k8s_job.command == ["echo", "hello"]
+
+
+def test_building_a_job_does_not_modify_nested_dict_subclasses():
+    job = KubernetesJob.base_job_manifest()
+    job["metadata"] = OrderedDict(labels=OrderedDict())
+    k8s_job = KubernetesJob(command=["echo", "hello"], job=job, labels={"foo": "bar"})
+
+    manifest = k8s_job.build_job()
+
+    assert manifest["metadata"]["labels"] == {"foo": "bar"}
+    assert k8s_job.job["metadata"] == OrderedDict(labels=OrderedDict())
+
+
 def test_creates_job_by_building_a_manifest(
     mock_k8s_batch_client,
     mock_k8s_client,
@@ -1146,6 +1169,67 @@ class TestLoadingManifestsFromFiles:
     def test_job_from_json(self, example: KubernetesManifest, example_json: Path):
         assert KubernetesJob.job_from_file(example_json) == example
 
+    def test_job_from_json_does_not_use_yaml(
+        self, monkeypatch, example: KubernetesManifest, example_json: Path
+    ):
+        monkeypatch.setattr(
+            "prefect.infrastructure.kubernetes.yaml.load",
+            MagicMock(side_effect=AssertionError("YAML loader should not be used")),
+        )
+        assert KubernetesJob.job_from_file(example_json) == example
+
+    def test_job_from_json_file_containing_yaml(
+        self, tmp_path: Path, example: KubernetesManifest
+    ):
+        filename = tmp_path / "example.json"
+        with open(filename, "w") as f:
+            yaml.dump(example, f)
+
+        assert KubernetesJob.job_from_file(filename) == example
+
+    def test_job_from_json_reads_exponents_as_floats(self, tmp_path: Path):
+        filename = tmp_path / "example.json"
+        filename.write_text('{"a": 1e3, "b": 1.5e3, "c": 1e+3}')
+
+        # The YAML loader would read each of these as a string
+        assert KubernetesJob.job_from_file(filename) == {
+            "a": 1000.0,
+            "b": 1500.0,
+            "c": 1000.0,
+        }
+
+    def test_job_from_json_with_non_standard_constants(self, tmp_path: Path):
+        filename = tmp_path / "example.json"
+        filename.write_text('{"a": NaN, "b": Infinity, "c": -Infinity}')
+
+        # These are not valid JSON, so the file is read by the YAML loader instead
+        assert KubernetesJob.job_from_file(filename) == {
+            "a": "NaN",
+            "b": "Infinity",
+            "c": "-Infinity",
+        }
+
+    def test_job_from_file_returns_copies(
+        self, example: KubernetesManifest, example_yaml: Path
+    ):
+        first = KubernetesJob.job_from_file(example_yaml)
+        first["metadata"]["labels"]["my-custom-label"] = "sour"
+
+        second = KubernetesJob.job_from_file(example_yaml)
+        assert second is not first
+        assert second == example
+
+    def test_job_from_file_reloads_modified_file(
+        self, example: KubernetesManifest, example_yaml: Path
+    ):
+        assert KubernetesJob.job_from_file(example_yaml) == example
+
+        example["metadata"]["labels"]["my-custom-label"] = "sour and sweet"
+        with open(example_yaml, "w") as f:
+            yaml.dump(example, f)
+
+        assert KubernetesJob.job_from_file(example_yaml) == example
+
 
 class TestLoadingPatchesFromFiles:
     def test_assumptions_about_jsonpatch(self):
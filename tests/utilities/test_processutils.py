@@ -1,12 +1,20 @@
+import io
 import signal
 import subprocess
 import sys
 from unittest import mock
 
+import anyio
 import pytest
+from anyio.streams.text import TextSendStream
 
 import prefect.utilities.processutils
-from prefect.utilities.processutils import kill_on_interrupt, open_process, run_process
+from prefect.utilities.processutils import (
+    kill_on_interrupt,
+    open_process,
+    run_process,
+    stream_text,
+)
 
 
 class TestRunProcess:
@@ -56,6 +64,90 @@ class TestRunProcess:
         assert process.returncode == 0
         assert (tmp_path / "output.txt").read_text().strip() == "hello world"
 
+    async def test_run_process_only_pipes_streams_with_sinks(
+        self, monkeypatch, tmp_path
+    ):
+        open_process_calls = []
+        open_process = prefect.utilities.processutils.open_process
+
+        def record_open_process(command, **kwargs):
+            open_process_calls.append(kwargs)
+            return open_process(command, **kwargs)
+
+        monkeypatch.setattr(
+            prefect.utilities.processutils, "open_process", record_open_process
+        )
+
+        with open(tmp_path / "output.txt", "wt") as fout:
+            process = await run_process(
+                ["echo", "hello world"], stream_output=(fout, None)
+            )
+
+        assert process.returncode == 0
+        assert open_process_calls[0]["stdout"] == subprocess.PIPE
+        assert open_process_calls[0]["stderr"] == subprocess.DEVNULL
+
+
+class TestStreamText:
+    async def test_unsupported_sink_errors_before_reading(self):
+        source = mock.MagicMock()
+
+        with pytest.raises(TypeError, match="Unsupported sink type object"):
+            await stream_text(source, object())
+
+        source.__aiter__.assert_not_called()
+
+    @pytest.mark.parametrize("stream_name", ["stdout", "stderr"])
+    async def test_flushes_partial_lines_to_standard_streams(
+        self, monkeypatch, stream_name
+    ):
+        buffer = io.BytesIO()
+        # A text wrapper holds writes back until it is flushed
+        monkeypatch.setattr(
+            sys, stream_name, io.TextIOWrapper(buffer, encoding="utf-8")
+        )
+        source_send, source_receive = anyio.create_memory_object_stream(10)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(stream_text, source_receive, getattr(sys, stream_name))
+            await source_send.send("no trailing newline")
+            await anyio.wait_all_tasks_blocked()
+
+            # The chunk arrives while the source is still open
+            assert buffer.getvalue() == b"no trailing newline"
+            await source_send.aclose()
+
+    async def test_yields_after_each_write_to_standard_streams(
+        self, monkeypatch, capsys
+    ):
+        sleep = mock.AsyncMock()
+        monkeypatch.setattr("anyio.sleep", sleep)
+        source_send, source_receive = anyio.create_memory_object_stream(10)
+        for item in ["first", "second"]:
+            await source_send.send(item)
+        await source_send.aclose()
+
+        await stream_text(source_receive, sys.stdout)
+
+        assert sleep.await_args_list == [mock.call(0), mock.call(0)]
+        assert capsys.readouterr().out == "firstsecond"
+
+    async def test_drains_source_when_cancelled(self):
+        source_send, source_receive = anyio.create_memory_object_stream(10)
+        # An unbuffered sink blocks the reader on its first write
+        sink_send, _sink_receive = anyio.create_memory_object_stream(0)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(stream_text, source_receive, TextSendStream(sink_send))
+            for item in ["first", "second", "third"]:
+                await source_send.send(item)
+            await source_send.aclose()
+
+            await anyio.wait_all_tasks_blocked()
+            tg.cancel_scope.cancel()
+
+        assert source_receive.statistics().current_buffer_used == 0
+
 
 class TestOpenProcess:
     str_cmd = "ls -a"
@@ -70,6 +162,45 @@ class TestOpenProcess:
         async with open_process(self.list_cmd) as process:
             assert process
 
+    async def test_runs_if_cmd_is_tuple(self):
+        async with open_process(tuple(self.list_cmd)) as process:
+            assert process
+
+    @pytest.mark.parametrize(
+        "command,expected",
+        [
+            (["ls", "-a"], "ls -a"),
+            (["dir", "C:\\Program Files\\x"], 'dir "C:\\Program Files\\x"'),
+            (["dir", '"C:\\Program Files\\x"'], 'dir "C:\\Program Files\\x"'),
+            (["echo", ""], 'echo ""'),
+        ],
+    )
+    def test_join_windows_command(self, command, expected):
+        assert prefect.utilities.processutils._join_windows_command(command) == expected
+
+    @pytest.mark.skipif(
+        sys.platform != "win32",
+        reason="Command joining is only used in Windows",
+    )
+    async def test_win32_arguments_with_spaces_reach_child(self, tmp_path):
+        unquoted = str(tmp_path / "with space" / "unquoted")
+        quoted = str(tmp_path / "with space" / "quoted")
+
+        out = io.StringIO()
+        process = await run_process(
+            [
+                sys.executable,
+                "-c",
+                "import sys; print('\\n'.join(sys.argv[1:]))",
+                unquoted,
+                f'"{quoted}"',
+            ],
+            stream_output=(out, None),
+        )
+
+        assert process.returncode == 0
+        assert out.getvalue().splitlines() == [unquoted, quoted]
+
     @pytest.mark.skipif(
         sys.platform != "win32",
         reason="CTRL_C_HANDLER is only defined in Windows",
@@ -109,6 +240,72 @@ class TestOpenProcess:
         )
         mock_set_console_ctrl_handler.assert_called_once_with(mock_ctrl_c_handler, 1)
 
+    @pytest.fixture
+    def terminate_spy(self, monkeypatch):
+        """
+        Wraps `terminate` on processes created by `open_process` with a mock.
+        """
+        if sys.platform == "win32":
+            module, name = prefect.utilities.processutils, "_open_anyio_process"
+        else:
+            module, name = anyio, "open_process"
+        original_open_process = getattr(module, name)
+        spy = mock.Mock()
+
+        async def open_process_with_spy(*args, **kwargs):
+            process = await original_open_process(*args, **kwargs)
+            spy.side_effect = process.terminate
+            process.terminate = spy
+            return process
+
+        monkeypatch.setattr(module, name, open_process_with_spy)
+
+        return spy
+
+    async def test_does_not_terminate_exited_process(self, terminate_spy):
+        process = await run_process([sys.executable, "-c", "pass"])
+        assert process.returncode == 0
+        terminate_spy.assert_not_called()
+
+    async def test_terminates_running_process_on_cancellation(self, terminate_spy):
+        with anyio.move_on_after(0.5):
+            async with open_process(
+                [sys.executable, "-c", "import time; time.sleep(30)"]
+            ) as process:
+                await process.wait()
+
+        terminate_spy.assert_called_once()
+
+    @pytest.mark.skipif(
+        sys.platform != "win32",
+        reason="Process groups are only tracked in Windows",
+    )
+    async def test_removes_win32_process_group_pid_if_terminate_fails(
+        self, monkeypatch
+    ):
+        mock_process = mock.AsyncMock()
+        mock_process.pid = 12345
+        mock_process.returncode = None
+        mock_process.terminate = mock.MagicMock(side_effect=ProcessLookupError)
+        monkeypatch.setattr(
+            prefect.utilities.processutils,
+            "_open_anyio_process",
+            mock.AsyncMock(return_value=mock_process),
+        )
+        monkeypatch.setattr(
+            prefect.utilities.processutils.windll.kernel32,
+            "SetConsoleCtrlHandler",
+            mock.Mock(),
+        )
+
+        async with open_process(
+            self.list_cmd, creationflags=subprocess.CREATE_NEW_PROCESS_GROUP
+        ):
+            assert 12345 in prefect.utilities.processutils._windows_process_group_pids
+
+        mock_process.terminate.assert_called_once()
+        assert 12345 not in prefect.utilities.processutils._windows_process_group_pids
+
 
 class TestKillOnInterrupt:
     @pytest.mark.skipif(